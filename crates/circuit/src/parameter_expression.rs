@@ -11,6 +11,8 @@
 // that they have been altered from the originals.
 
 // ParameterExpression class for symbolic equation on Rust / interface to Python
+use crate::circuit_data::CircuitError;
+use crate::imports::NUMBERS_NUMBER;
 use crate::symbol_expr;
 use crate::symbol_expr::SymbolExpr;
 use crate::symbol_parser::parse_expression;
@@ -23,7 +25,9 @@ use std::fmt;
 use std::hash::{Hash, Hasher};
 use std::sync::Arc;
 
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::{PyComplex, PyFloat, PyInt};
 use pyo3::IntoPyObjectExt;
 
 // Python interface to SymbolExpr
@@ -58,6 +62,96 @@ fn _extract_value(value: &Bound<PyAny>) -> Option<ParameterExpression> {
     }
 }
 
+#[inline]
+fn _extract_number(value: &Bound<PyAny>) -> Option<symbol_expr::Value> {
+    // Check the concrete built-in types first.  A failed `extract` constructs a Python exception,
+    // which is far too expensive to do for every value in the common case of binding floats.  This
+    // deliberately accepts subclasses of `float`, which includes `numpy.float64`, so values taken
+    // from Numpy arrays (e.g. `dict(zip(parameters, array))`) hit the fast path too.
+    if let Ok(r) = value.downcast::<PyFloat>() {
+        return Some(symbol_expr::Value::from(r.value()));
+    }
+    if value.is_exact_instance_of::<PyInt>() {
+        if let Ok(i) = value.extract::<i64>() {
+            return Some(symbol_expr::Value::from(i));
+        }
+        // The `int` is outside the range of `i64`, so don't fail that same extraction again.
+    } else if let Ok(i) = value.extract::<i64>() {
+        return Some(symbol_expr::Value::from(i));
+    }
+    if let Ok(r) = value.extract::<f64>() {
+        Some(symbol_expr::Value::from(r))
+    } else if let Ok(c) = value.extract::<Complex64>() {
+        Some(symbol_expr::Value::from(c))
+    } else {
+        None
+    }
+}
+
+/// Whether `value` is an instance of `numbers.Number`, which is the rule `bind` validates values by.
+fn _is_number(value: &Bound<PyAny>) -> PyResult<bool> {
+    // The built-in numeric types (and their subclasses, such as `bool` and `numpy.float64`) are all
+    // registered as numbers, so check them directly before the slower `isinstance` against the ABC.
+    if value.is_instance_of::<PyFloat>()
+        || value.is_instance_of::<PyInt>()
+        || value.is_instance_of::<PyComplex>()
+    {
+        return Ok(true);
+    }
+    value.is_instance(NUMBERS_NUMBER.get_bound(value.py()))
+}
+
+impl ParameterExpression {
+    /// bind values to symbols and check the result of the evaluation if no symbols remain
+    fn bind_values(&self, map: &HashMap<String, symbol_expr::Value>) -> PyResult<Self> {
+        let bound = self.expr.bind(map);
+        match bound.eval(true) {
+            Some(v) => match &v {
+                symbol_expr::Value::Real(r) => {
+                    if r.is_infinite() {
+                        Err(pyo3::exceptions::PyZeroDivisionError::new_err(
+                            "attempted to bind infinite value to parameter",
+                        ))
+                    } else if r.is_nan() {
+                        Err(pyo3::exceptions::PyRuntimeError::new_err(
+                            "NAN detected while binding parameter",
+                        ))
+                    } else {
+                        Ok(Self {
+                            expr: SymbolExpr::Value(v),
+                        })
+                    }
+                }
+                symbol_expr::Value::Int(_) => Ok(Self {
+                    expr: SymbolExpr::Value(v),
+                }),
+                symbol_expr::Value::Complex(c) => {
+                    if c.re.is_infinite() || c.im.is_infinite() {
+                        Err(pyo3::exceptions::PyZeroDivisionError::new_err(
+                            "zero division occurs while binding parameter",
+                        ))
+                    } else if c.re.is_nan() || c.im.is_nan() {
+                        Err(pyo3::exceptions::PyRuntimeError::new_err(
+                            "NAN detected while binding parameter",
+                        ))
+                    } else if (-symbol_expr::SYMEXPR_EPSILON..symbol_expr::SYMEXPR_EPSILON)
+                        .contains(&c.im)
+                    {
+                        Ok(Self {
+                            expr: SymbolExpr::Value(symbol_expr::Value::Real(c.re)),
+                        })
+                    } else {
+                        Ok(Self {
+                            expr: SymbolExpr::Value(v),
+                        })
+                    }
+                }
+            },
+            None => Ok(Self { expr: bound }),
+        }
+    }
+}
+
 #[pymethods]
 impl ParameterExpression {
     /// parse expression from string
@@ -248,66 +342,56 @@ impl ParameterExpression {
     /// bind values to symbols given by input hashmap
     #[pyo3(name = "bind")]
     pub fn py_bind(&self, map: HashMap<String, Bound<PyAny>>) -> PyResult<Self> {
+        // if unsupported data type, insert nothing
         let map: HashMap<String, symbol_expr::Value> = map
             .into_iter()
-            .filter_map(|(key, val)| {
-                if let Ok(i) = val.extract::<i64>() {
-                    Some((key, symbol_expr::Value::from(i)))
-                } else if let Ok(r) = val.extract::<f64>() {
-                    Some((key, symbol_expr::Value::from(r)))
-                } else if let Ok(c) = val.extract::<Complex64>() {
-                    Some((key, symbol_expr::Value::from(c)))
-                } else {
-                    // if unsupported data type, insert nothing
-                    None
-                }
-            })
+            .filter_map(|(key, val)| _extract_number(&val).map(|v| (key, v)))
             .collect();
-        let bound = self.expr.bind(&map);
-        match bound.eval(true) {
-            Some(v) => match &v {
-                symbol_expr::Value::Real(r) => {
-                    if r.is_infinite() {
-                        Err(pyo3::exceptions::PyZeroDivisionError::new_err(
-                            "attempted to bind infinite value to parameter",
-                        ))
-                    } else if r.is_nan() {
-                        Err(pyo3::exceptions::PyRuntimeError::new_err(
-                            "NAN detected while binding parameter",
-                        ))
-                    } else {
-                        Ok(Self {
-                            expr: SymbolExpr::Value(v),
-                        })
-                    }
-                }
-                symbol_expr::Value::Int(_) => Ok(Self {
-                    expr: SymbolExpr::Value(v),
-                }),
-                symbol_expr::Value::Complex(c) => {
-                    if c.re.is_infinite() || c.im.is_infinite() {
-                        Err(pyo3::exceptions::PyZeroDivisionError::new_err(
-                            "zero division occurs while binding parameter",
-                        ))
-                    } else if c.re.is_nan() || c.im.is_nan() {
-                        Err(pyo3::exceptions::PyRuntimeError::new_err(
-                            "NAN detected while binding parameter",
-                        ))
-                    } else if (-symbol_expr::SYMEXPR_EPSILON..symbol_expr::SYMEXPR_EPSILON)
-                        .contains(&c.im)
-                    {
-                        Ok(Self {
-                            expr: SymbolExpr::Value(symbol_expr::Value::Real(c.re)),
-                        })
-                    } else {
-                        Ok(Self {
-                            expr: SymbolExpr::Value(v),
-                        })
-                    }
-                }
-            },
-            None => Ok(Self { expr: bound }),
-        }
+        self.bind_values(&map)
+    }
+
+    /// bind values to symbols given by a list of symbol names and a matching list of values
+    ///
+    /// Unlike `bind`, every value is validated and a value that is not a `numbers.Number`, or that
+    /// cannot be converted to an int, float or complex, raises `CircuitError` instead of being
+    /// skipped.  A name of `None` marks a value that is validated, but that does
+    /// not correspond to any symbol in this expression.
+    ///
+    /// If no symbols remain after binding, the result is checked as in `bind`: an infinite value
+    /// raises `ZeroDivisionError`, so callers don't need to inspect the result themselves.
+    pub fn bind_by_params(
+        &self,
+        names: Vec<Option<String>>,
+        values: Vec<Bound<PyAny>>,
+    ) -> PyResult<Self> {
+        if names.len() != values.len() {
+            return Err(PyValueError::new_err(format!(
+                "mismatched number of names ({}) and values ({})",
+                names.len(),
+                values.len()
+            )));
+        }
+        let mut map = HashMap::with_capacity(names.len());
+        for (name, value) in names.into_iter().zip(values.iter()) {
+            let number = if _is_number(value)? {
+                _extract_number(value)
+            } else {
+                None
+            };
+            let Some(number) = number else {
+                // The Python caller rebuilds this message with the parameters of every non-numeric
+                // value, since only it knows them.  This message is what remains in the rare case of
+                // a `numbers.Number` that can't be converted, so report just the first bad value.
+                return Err(CircuitError::new_err(format!(
+                    "Expression cannot bind non-numeric value ({})",
+                    value.repr()?
+                )));
+            };
+            if let Some(name) = name {
+                map.insert(name, number);
+            }
+        }
+        self.bind_values(&map)
     }
 
     /// substitute symbols to expressions (or values) given by hash map
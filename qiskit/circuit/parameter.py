@@ -91,7 +91,8 @@ class Parameter(ParameterExpression):
         self._hash = hash((self._parameter_keys, self._symbol_expr))
         self._parameter_symbols = {self: symbol}
         self._name_map = None
-        self._qpy_replay = []
+        self._symbol_name_map = None
+        self._qpy_replay = None
         self._standalone_param = True
 
     def assign(self, parameter, value):
@@ -178,7 +179,8 @@ class Parameter(ParameterExpression):
         self._hash = hash((self._parameter_keys, self._symbol_expr))
         self._parameter_symbols = {self: self._symbol_expr}
         self._name_map = None
-        self._qpy_replay = []
+        self._symbol_name_map = None
+        self._qpy_replay = None
         self._standalone_param = True
 
     @HAS_SYMPY.require_in_call
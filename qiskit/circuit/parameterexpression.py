@@ -15,9 +15,9 @@ ParameterExpression Class to enable creating simple expressions of Parameters.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import IntEnum
-from typing import Callable, Union
+from typing import Callable, NamedTuple, Union
+import math
 import numbers
 import operator
 
@@ -89,19 +89,93 @@ def op_code_to_method(op_code: _OPCode):
     return _OP_CODE_MAP[op_code]
 
 
-@dataclass
-class _INSTRUCTION:
+# Operations that take two operands, (of those) the commutative operations which `sympify` may
+# apply with the operands reflected, and the operations whose opcode itself records the reflection.
+_BINARY_OPS = frozenset(
+    {
+        _OPCode.ADD,
+        _OPCode.SUB,
+        _OPCode.MUL,
+        _OPCode.DIV,
+        _OPCode.POW,
+        _OPCode.GRAD,
+        _OPCode.SUBSTITUTE,
+        _OPCode.RSUB,
+        _OPCode.RDIV,
+        _OPCode.RPOW,
+    }
+)
+_REFLECTABLE = frozenset({_OPCode.ADD, _OPCode.MUL})
+_REFLECTED_OPS = frozenset({_OPCode.RSUB, _OPCode.RDIV, _OPCode.RPOW})
+
+# The names of the Sympy functions implementing each single-operand operation.
+_SYMPY_FUNCTION_NAMES = {
+    _OPCode.SIN: "sin",
+    _OPCode.COS: "cos",
+    _OPCode.TAN: "tan",
+    _OPCode.ASIN: "asin",
+    _OPCode.ACOS: "acos",
+    _OPCode.EXP: "exp",
+    _OPCode.LOG: "log",
+    _OPCode.SIGN: "sign",
+    _OPCode.CONJ: "conjugate",
+    _OPCode.ABS: "Abs",
+    _OPCode.ATAN: "atan",
+}
+# The resolved functions for `_SYMPY_FUNCTION_NAMES`.  This is filled on the first call to
+# `ParameterExpression.sympify`, because Sympy is an optional dependency.
+_SYMPY_FUNCS = {}
+
+
+# These are immutable and have no instance `__dict__`, since one is allocated for every operation
+# on an expression, and they're shared between the replays of all expressions derived from it.
+class _INSTRUCTION(NamedTuple):
     op: _OPCode
     lhs: ParameterValueType | None
     rhs: ParameterValueType | None = None
 
 
-@dataclass
-class _SUBS:
+class _SUBS(NamedTuple):
     binds: dict
     op: _OPCode = _OPCode.SUBSTITUTE
 
 
+class _Replay:
+    """A node in the immutable linked list of operations used to build an expression.
+
+    Each node stores only the most recent operation and a reference to the history it extends, so
+    an expression derived from another records its new operation in constant time, and never needs
+    to copy the history of its parent.  Iterating over a node yields the operations in the order
+    they were applied.
+    """
+
+    __slots__ = ("parent", "op")
+
+    def __init__(self, parent: _Replay | None, op: _INSTRUCTION | _SUBS):
+        self.parent = parent
+        self.op = op
+
+    def __iter__(self):
+        ops = []
+        node = self
+        while node is not None:
+            ops.append(node.op)
+            node = node.parent
+        return reversed(ops)
+
+    def __reduce__(self):
+        # Pickle as a flat list, so long histories don't hit the recursion limit.
+        return (_replay_from_ops, (list(self),))
+
+
+def _replay_from_ops(ops) -> _Replay | None:
+    """Build the :class:`_Replay` chain recording the iterable of operations ``ops``."""
+    replay = None
+    for op in ops:
+        replay = _Replay(replay, op)
+    return replay
+
+
 class ParameterExpression:
     """ParameterExpression class to enable creating expressions of Parameters."""
 
@@ -110,8 +184,11 @@ class ParameterExpression:
         "_parameter_keys",
         "_symbol_expr",
         "_name_map",
+        "_symbol_name_map",
         "_qpy_replay",
         "_standalone_param",
+        "_cached_value",
+        "_cached_hash",
     ]
 
     def __init__(self, symbol_map: dict, expr, *, _qpy_replay=None):
@@ -141,13 +218,14 @@ class ParameterExpression:
             for param in symbol_map.keys():
                 self._parameter_symbols[param] = SymbolExpr.Symbol(param.name)
         self._name_map: dict | None = None
-        self._parameter_keys = frozenset(p._hash_key() for p in self._parameter_symbols)
+        self._symbol_name_map: dict | None = None
+        # Built on first use by `_parameter_hash_keys`; most expressions are never hashed.
+        self._parameter_keys: frozenset | None = None
 
         self._standalone_param = False
-        if _qpy_replay is not None:
-            self._qpy_replay = _qpy_replay
-        else:
-            self._qpy_replay = []
+        self._qpy_replay = _qpy_replay
+        # `_cached_value` and `_cached_hash` are deliberately left unset until first computed,
+        # rather than using a sentinel object, which would not keep its identity through pickling.
 
     @property
     def parameters(self) -> set:
@@ -161,14 +239,42 @@ class ParameterExpression:
             self._name_map = {p.name: p for p in self._parameter_symbols}
         return self._name_map
 
+    def _value(self):
+        """Returns the numeric value of the underlying symbolic expression.
+
+        This is cached after the first successful evaluation; expressions are immutable.
+
+        Raises:
+            RuntimeError: if the expression contains unbound symbols.
+        """
+        try:
+            return self._cached_value
+        except AttributeError:
+            pass
+        value = self._cached_value = self._symbol_expr.value()
+        return value
+
+    @property
+    def _parameter_hash_keys(self) -> frozenset:
+        """Returns the set of the hash keys of the Parameters in the expression."""
+        if self._parameter_keys is None:
+            self._parameter_keys = frozenset(p._hash_key() for p in self._parameter_symbols)
+        return self._parameter_keys
+
+    @property
+    def _symbol_names(self) -> dict:
+        """Returns a mapping of Parameters in the expression to the names of their symbols."""
+        if self._symbol_name_map is None:
+            self._symbol_name_map = {p: str(s) for p, s in self._parameter_symbols.items()}
+        return self._symbol_name_map
+
     def conjugate(self) -> "ParameterExpression":
         """Return the conjugate."""
         if self._standalone_param:
             new_op = _INSTRUCTION(_OPCode.CONJ, self)
         else:
             new_op = _INSTRUCTION(_OPCode.CONJ, None)
-        new_replay = self._qpy_replay.copy()
-        new_replay.append(new_op)
+        new_replay = _Replay(self._qpy_replay, new_op)
         conjugated = ParameterExpression(
             self._parameter_symbols, self._symbol_expr.conjugate(), _qpy_replay=new_replay
         )
@@ -213,39 +319,58 @@ class ParameterExpression:
             A new expression parameterized by any parameters which were not bound by
             parameter_values.
         """
-        if not allow_unknown_parameters:
-            self._raise_if_passed_unknown_parameters(parameter_values.keys())
-        self._raise_if_passed_nan(parameter_values)
-
-        new_op = _SUBS(parameter_values)
-        symbol_values = {}
-        for parameter, value in parameter_values.items():
-            if (param_expr := self._parameter_symbols.get(parameter)) is not None:
-                symbol_values[str(param_expr)] = value
-
-        bound_symbol_expr = self._symbol_expr.bind(symbol_values)
-
         # Don't use sympy.free_symbols to count remaining parameters here.
         # sympy will in some cases reduce the expression and remove even
         # unbound symbols.
         # e.g. (sympy.Symbol('s') * 0).free_symbols == set()
-
-        free_parameters = self.parameters - parameter_values.keys()
-        free_parameter_symbols = {
-            p: s for p, s in self._parameter_symbols.items() if p in free_parameters
-        }
-
+        parameter_symbols = self._parameter_symbols
         if (
-            hasattr(bound_symbol_expr, "is_infinite") and bound_symbol_expr.is_infinite
-        ) or bound_symbol_expr == float("inf"):
+            len(parameter_values) >= len(parameter_symbols)
+            and parameter_symbols.keys() <= parameter_values.keys()
+        ):
+            # The common case of binding every parameter.  No parameters are left free, and there
+            # can only be unknown parameters if there are more values than parameters.
+            if not allow_unknown_parameters and len(parameter_values) > len(parameter_symbols):
+                self._raise_if_passed_unknown_parameters(parameter_values.keys())
+            free_parameter_symbols = {}
+        else:
+            if not allow_unknown_parameters:
+                self._raise_if_passed_unknown_parameters(parameter_values.keys())
+            free_parameter_symbols = {
+                p: s for p, s in parameter_symbols.items() if p not in parameter_values
+            }
+
+        new_op = _SUBS(parameter_values)
+        # The values are validated as numeric in Rust, all in the same call that binds them.
+        # Parameters not in this expression are passed with no name, so they're checked but unused.
+        symbol_names = self._symbol_names
+        names = [symbol_names.get(parameter) for parameter in parameter_values]
+        # Rust also checks the result, and raises if binding produced an infinite value.
+        try:
+            bound_symbol_expr = self._symbol_expr.bind_by_params(
+                names, list(parameter_values.values())
+            )
+        except CircuitError as exc:
+            # Rust only sees the values, so name the parameters they were bound to ourselves.  This
+            # is only done on failure, so the successful path never checks the values in Python.
+            nan_parameter_values = {
+                p: v for p, v in parameter_values.items() if not isinstance(v, numbers.Number)
+            }
+            if not nan_parameter_values:
+                # A `numbers.Number` that can't be converted to a number Rust understands.
+                raise
+            raise CircuitError(
+                f"Expression cannot bind non-numeric values ({nan_parameter_values})"
+            ) from exc
+        except ZeroDivisionError as exc:
+            # Rust raises this both for an infinite value bound directly and for a division by zero.
             raise ZeroDivisionError(
                 "Binding provided for expression "
-                "results in division by zero "
+                "results in an infinite value, from division by zero or an infinite binding "
                 f"(Expression: {self}, Bindings: {parameter_values})."
-            )
+            ) from exc
 
-        new_replay = self._qpy_replay.copy()
-        new_replay.append(new_op)
+        new_replay = _Replay(self._qpy_replay, new_op)
 
         return ParameterExpression(
             free_parameter_symbols, bound_symbol_expr, _qpy_replay=new_replay
@@ -275,11 +400,10 @@ class ParameterExpression:
         if not allow_unknown_parameters:
             self._raise_if_passed_unknown_parameters(parameter_map.keys())
 
-        inbound_names = {
-            p.name: p
-            for replacement_expr in parameter_map.values()
-            for p in replacement_expr.parameters
-        }
+        # Reuse the (cached) name maps of the replacements rather than fetching every name again.
+        inbound_names = {}
+        for replacement_expr in parameter_map.values():
+            inbound_names.update(replacement_expr._names)
         self._raise_if_parameter_names_conflict(inbound_names, parameter_map.keys())
         new_op = _SUBS(parameter_map)
 
@@ -292,15 +416,15 @@ class ParameterExpression:
         # If new_param is an expr, we'll need to construct a matching sympy expr
         # but with our sympy symbols instead of theirs.
         symbol_map = {}
+        symbol_names = self._symbol_names
         for old_param, new_param in parameter_map.items():
-            if (old_symbol := self._parameter_symbols.get(old_param)) is not None:
-                symbol_map[str(old_symbol)] = new_param._symbol_expr
+            if (old_name := symbol_names.get(old_param)) is not None:
+                symbol_map[old_name] = new_param._symbol_expr
                 for p in new_param.parameters:
                     new_parameter_symbols[p] = symbol_type(p.name)
 
         substituted_symbol_expr = self._symbol_expr.subs(symbol_map)
-        new_replay = self._qpy_replay.copy()
-        new_replay.append(new_op)
+        new_replay = _Replay(self._qpy_replay, new_op)
 
         return ParameterExpression(
             new_parameter_symbols, substituted_symbol_expr, _qpy_replay=new_replay
@@ -314,15 +438,6 @@ class ParameterExpression:
                 "expression."
             )
 
-    def _raise_if_passed_nan(self, parameter_values):
-        nan_parameter_values = {
-            p: v for p, v in parameter_values.items() if not isinstance(v, numbers.Number)
-        }
-        if nan_parameter_values:
-            raise CircuitError(
-                f"Expression cannot bind non-numeric values ({nan_parameter_values})"
-            )
-
     def _raise_if_parameter_names_conflict(self, inbound_parameters, outbound_parameters=None):
         if outbound_parameters is None:
             outbound_parameters = set()
@@ -367,45 +482,83 @@ class ParameterExpression:
         Returns:
             A new expression describing the result of the operation.
         """
-        self_expr = self._symbol_expr
-        if isinstance(other, ParameterExpression):
+        if not isinstance(other, ParameterExpression):
+            if isinstance(other, numbers.Number) and numpy.isfinite(other):
+                return self._apply_scalar(operation, other, reflected, op_code)
+            return NotImplemented
+
+        # The symbol table of an expression is never mutated after construction, so results that
+        # involve the same parameters as `self` share its table rather than copying it.
+        if other._parameter_symbols is self._parameter_symbols or (
+            self._parameter_keys is not None and self._parameter_keys == other._parameter_keys
+        ):
+            # Identical sets of parameters can't have conflicting names, so there's no need to
+            # check (or to build the name maps to do so).
+            parameter_symbols = self._parameter_symbols
+        else:
             self._raise_if_parameter_names_conflict(other._names)
             parameter_symbols = {**self._parameter_symbols, **other._parameter_symbols}
-            other_expr = other._symbol_expr
-        elif isinstance(other, numbers.Number) and numpy.isfinite(other):
-            parameter_symbols = self._parameter_symbols.copy()
-            other_expr = other
-        else:
-            return NotImplemented
 
         if reflected:
-            expr = operation(other_expr, self_expr)
-            if op_code in {_OPCode.RSUB, _OPCode.RDIV, _OPCode.RPOW}:
-                if self._standalone_param:
-                    new_op = _INSTRUCTION(op_code, self, other)
-                else:
-                    new_op = _INSTRUCTION(op_code, None, other)
-            else:
-                if self._standalone_param:
-                    new_op = _INSTRUCTION(op_code, other, self)
-                else:
-                    new_op = _INSTRUCTION(op_code, other, None)
+            expr = operation(other._symbol_expr, self._symbol_expr)
         else:
-            expr = operation(self_expr, other_expr)
-            if self._standalone_param:
-                new_op = _INSTRUCTION(op_code, self, other)
-            else:
-                new_op = _INSTRUCTION(op_code, None, other)
-        new_replay = self._qpy_replay.copy()
-        new_replay.append(new_op)
+            expr = operation(self._symbol_expr, other._symbol_expr)
+        out_expr = ParameterExpression(
+            parameter_symbols, expr, _qpy_replay=self._record_operation(op_code, other, reflected)
+        )
+        # Name maps are never mutated once built, so the result can reuse its parents' maps if
+        # they're already available.  Otherwise, it's left for `_names` to build on first access.
+        if parameter_symbols is self._parameter_symbols:
+            self._share_symbol_caches(out_expr)
+        elif self._name_map is not None and other._name_map is not None:
+            out_expr._name_map = {**self._name_map, **other._name_map}
 
-        out_expr = ParameterExpression(parameter_symbols, expr, _qpy_replay=new_replay)
-        out_expr._name_map = self._names.copy()
-        if isinstance(other, ParameterExpression):
-            out_expr._names.update(other._names.copy())
+        return out_expr
+
+    def _apply_scalar(
+        self,
+        operation: Callable,
+        other: numbers.Number,
+        reflected: bool = False,
+        op_code: _OPCode = None,
+    ) -> "ParameterExpression":
+        """Specialization of :meth:`_apply_operation` for a numeric ``other``.
 
+        The arithmetic dunder methods call this directly when ``other`` is exactly an ``int`` or a
+        ``float``, the most common operands when building parametric circuits, skipping the more
+        general type checks.  The result has the same parameters as ``self``, so there can be no
+        name conflicts, and the symbol table is shared with ``self``.
+        """
+        if type(other) is float and not math.isfinite(other):
+            return NotImplemented
+        if reflected:
+            expr = operation(other, self._symbol_expr)
+        else:
+            expr = operation(self._symbol_expr, other)
+        out_expr = ParameterExpression(
+            self._parameter_symbols,
+            expr,
+            _qpy_replay=self._record_operation(op_code, other, reflected),
+        )
+        self._share_symbol_caches(out_expr)
         return out_expr
 
+    def _record_operation(self, op_code: _OPCode, other, reflected: bool) -> _Replay:
+        """Returns the QPY replay of ``self`` extended by an operation with ``other``."""
+        lhs = self if self._standalone_param else None
+        if reflected and op_code not in _REFLECTED_OPS:
+            new_op = _INSTRUCTION(op_code, other, lhs)
+        else:
+            new_op = _INSTRUCTION(op_code, lhs, other)
+        return _Replay(self._qpy_replay, new_op)
+
+    def _share_symbol_caches(self, out_expr: "ParameterExpression"):
+        """Shares the caches derived from the symbol table of ``self`` with the expression
+        ``out_expr``, which must be using the same symbol table."""
+        out_expr._name_map = self._name_map
+        out_expr._symbol_name_map = self._symbol_name_map
+        out_expr._parameter_keys = self._parameter_keys
+
     def gradient(self, param) -> Union["ParameterExpression", complex]:
         """Get the derivative of a real parameter expression w.r.t. a specified parameter.
 
@@ -431,8 +584,7 @@ class ParameterExpression:
             new_op = _INSTRUCTION(_OPCode.GRAD, self, param)
         else:
             new_op = _INSTRUCTION(_OPCode.GRAD, None, param)
-        qpy_replay = self._qpy_replay.copy()
-        qpy_replay.append(new_op)
+        qpy_replay = _Replay(self._qpy_replay, new_op)
 
         # Compute the gradient of the parameter expression w.r.t. param
         key = self._parameter_symbols[param]
@@ -441,10 +593,13 @@ class ParameterExpression:
         # generate the new dictionary of symbols
         # this needs to be done since in the derivative some symbols might disappear (e.g.
         # when deriving linear expression)
-        parameter_symbols = {}
-        for parameter, symbol in self._parameter_symbols.items():
-            if symbol.name in expr_grad.symbols():
-                parameter_symbols[parameter] = symbol
+        grad_names = expr_grad.symbols()
+        symbol_names = self._symbol_names
+        parameter_symbols = {
+            parameter: symbol
+            for parameter, symbol in self._parameter_symbols.items()
+            if symbol_names[parameter] in grad_names
+        }
         # If the gradient corresponds to a parameter expression then return the new expression.
         if len(parameter_symbols) > 0:
             return ParameterExpression(parameter_symbols, expr=expr_grad, _qpy_replay=qpy_replay)
@@ -452,41 +607,61 @@ class ParameterExpression:
         return expr_grad.value()
 
     def __add__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.add, other, op_code=_OPCode.ADD)
         return self._apply_operation(operator.add, other, op_code=_OPCode.ADD)
 
     def __radd__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.add, other, reflected=True, op_code=_OPCode.ADD)
         return self._apply_operation(operator.add, other, reflected=True, op_code=_OPCode.ADD)
 
     def __sub__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.sub, other, op_code=_OPCode.SUB)
         return self._apply_operation(operator.sub, other, op_code=_OPCode.SUB)
 
     def __rsub__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.sub, other, reflected=True, op_code=_OPCode.RSUB)
         return self._apply_operation(operator.sub, other, reflected=True, op_code=_OPCode.RSUB)
 
     def __mul__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.mul, other, op_code=_OPCode.MUL)
         return self._apply_operation(operator.mul, other, op_code=_OPCode.MUL)
 
     def __pos__(self):
-        return self._apply_operation(operator.mul, 1, op_code=_OPCode.MUL)
+        return self._apply_scalar(operator.mul, 1, op_code=_OPCode.MUL)
 
     def __neg__(self):
-        return self._apply_operation(operator.mul, -1, op_code=_OPCode.MUL)
+        return self._apply_scalar(operator.mul, -1, op_code=_OPCode.MUL)
 
     def __rmul__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.mul, other, reflected=True, op_code=_OPCode.MUL)
         return self._apply_operation(operator.mul, other, reflected=True, op_code=_OPCode.MUL)
 
     def __truediv__(self, other):
         if other == 0:
             raise ZeroDivisionError("Division of a ParameterExpression by zero.")
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.truediv, other, op_code=_OPCode.DIV)
         return self._apply_operation(operator.truediv, other, op_code=_OPCode.DIV)
 
     def __rtruediv__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(operator.truediv, other, reflected=True, op_code=_OPCode.RDIV)
         return self._apply_operation(operator.truediv, other, reflected=True, op_code=_OPCode.RDIV)
 
     def __pow__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(pow, other, op_code=_OPCode.POW)
         return self._apply_operation(pow, other, op_code=_OPCode.POW)
 
     def __rpow__(self, other):
+        if type(other) in (int, float):
+            return self._apply_scalar(pow, other, reflected=True, op_code=_OPCode.RPOW)
         return self._apply_operation(pow, other, reflected=True, op_code=_OPCode.RPOW)
 
     def _call(self, ufunc, op_code):
@@ -494,8 +669,7 @@ class ParameterExpression:
             new_op = _INSTRUCTION(op_code, self)
         else:
             new_op = _INSTRUCTION(op_code, None)
-        new_replay = self._qpy_replay.copy()
-        new_replay.append(new_op)
+        new_replay = _Replay(self._qpy_replay, new_op)
         return ParameterExpression(
             self._parameter_symbols, ufunc(self._symbol_expr), _qpy_replay=new_replay
         )
@@ -544,7 +718,7 @@ class ParameterExpression:
 
     def __complex__(self):
         try:
-            return complex(self._symbol_expr.value())
+            return complex(self._value())
         # TypeError is for sympy, RuntimeError for symengine
         except (TypeError, RuntimeError) as exc:
             if self.parameters:
@@ -556,7 +730,7 @@ class ParameterExpression:
 
     def __float__(self):
         try:
-            return float(self._symbol_expr.value())
+            return float(self._value())
         # TypeError is for sympy, RuntimeError for symengine
         except (TypeError, RuntimeError) as exc:
             if self.parameters:
@@ -576,7 +750,7 @@ class ParameterExpression:
 
     def __int__(self):
         try:
-            return int(self._symbol_expr.value())
+            return int(self._value())
         # TypeError is for backwards compatibility, RuntimeError is raised by symengine
         except RuntimeError as exc:
             if self.parameters:
@@ -587,10 +761,29 @@ class ParameterExpression:
             raise TypeError("could not cast expression to int") from exc
 
     def __hash__(self):
+        # This is cached on first use, since hashing the symbolic expression goes through its string
+        # form in Rust, and we are immutable.
+        try:
+            return self._cached_hash
+        except AttributeError:
+            pass
         if not self._parameter_symbols:
             # For fully bound expressions, fall back to the underlying value
-            return hash(self.numeric())
-        return hash((self._parameter_keys, self._symbol_expr))
+            out = hash(self.numeric())
+        else:
+            out = hash((self._parameter_hash_keys, self._symbol_expr))
+        self._cached_hash = out
+        return out
+
+    def __getstate__(self):
+        # The cached hash is left out of the pickled state, so that it is always recomputed by the
+        # process (and Qiskit build) that will use it.
+        state = {
+            slot: getattr(self, slot)
+            for slot in ParameterExpression.__slots__
+            if slot != "_cached_hash" and hasattr(self, slot)
+        }
+        return (None, state)
 
     def __copy__(self):
         return self
@@ -615,8 +808,11 @@ class ParameterExpression:
         Returns:
             bool: result of the comparison
         """
+        if self is other:
+            return True
         if isinstance(other, ParameterExpression):
-            if self.parameters != other.parameters:
+            # The key sets are cached on each expression, so repeated comparisons are cheap.
+            if self._parameter_hash_keys != other._parameter_hash_keys:
                 return False
 
             return self._symbol_expr == other._symbol_expr
@@ -627,7 +823,7 @@ class ParameterExpression:
     def is_real(self):
         """Return whether the expression is real"""
         try:
-            val = self._symbol_expr.value()
+            val = self._value()
             return not isinstance(val, complex)
         except RuntimeError:
             return None
@@ -663,7 +859,7 @@ class ParameterExpression:
             raise TypeError(
                 f"Expression with unbound parameters '{self.parameters}' is not numeric"
             )
-        return self._symbol_expr.value()
+        return self._value()
 
     @HAS_SYMPY.require_in_call
     def sympify(self):
@@ -677,58 +873,59 @@ class ParameterExpression:
         """
         import sympy
 
+        if not _SYMPY_FUNCS:
+            _SYMPY_FUNCS.update(
+                {op: getattr(sympy, name) for op, name in _SYMPY_FUNCTION_NAMES.items()}
+            )
+
+        # The replay can be thousands of operations long, so hoist the globals used in the loop.
+        binary_ops = _BINARY_OPS
+        reflectable = _REFLECTABLE
+        sympy_funcs = _SYMPY_FUNCS
+        method_names = _OP_CODE_MAP
+        expression_type = ParameterExpression
+        subs_type = _SUBS
+        sympy_basic = sympy.Basic
+
         output = None
-        for inst in self._qpy_replay:
-            if isinstance(inst, _SUBS):
+        for inst in self._qpy_replay or ():
+            if isinstance(inst, subs_type):
                 sympy_binds = {}
                 for old, new in inst.binds.items():
-                    if isinstance(new, ParameterExpression):
+                    if isinstance(new, expression_type):
                         new = new.sympify()
                     sympy_binds[old.sympify()] = new
                 output = output.subs(sympy_binds, simultaneous=True)
                 continue
 
-            if isinstance(inst.lhs, ParameterExpression):
-                lhs = inst.lhs.sympify()
-            elif inst.lhs is None:
+            op, lhs, rhs = inst.op, inst.lhs, inst.rhs
+            if isinstance(lhs, expression_type):
+                lhs = lhs.sympify()
+            elif lhs is None:
                 lhs = output
-            else:
-                lhs = inst.lhs
 
-            method_str = _OP_CODE_MAP[inst.op]
-            if inst.op in {0, 1, 2, 3, 4, 13, 15, 18, 19, 20}:
-                if inst.rhs is None:
+            if op in binary_ops:
+                if rhs is None:
                     rhs = output
-                elif isinstance(inst.rhs, ParameterExpression):
-                    rhs = inst.rhs.sympify()
-                else:
-                    rhs = inst.rhs
+                elif isinstance(rhs, expression_type):
+                    rhs = rhs.sympify()
 
                 if (
-                    not isinstance(lhs, sympy.Basic)
-                    and isinstance(rhs, sympy.Basic)
-                    and inst.op in [0, 2]
+                    not isinstance(lhs, sympy_basic)
+                    and isinstance(rhs, sympy_basic)
+                    and op in reflectable
                 ):
-                    if inst.op == 0:
+                    if op == _OPCode.ADD:
                         method_str = "__radd__"
-                    elif inst.op == 2:
+                    else:
                         method_str = "__rmul__"
                     output = getattr(rhs, method_str)(lhs)
-                elif inst.op == _OPCode.GRAD:
-                    output = getattr(lhs, "diff")(rhs)
+                elif op == _OPCode.GRAD:
+                    output = lhs.diff(rhs)
                 else:
-                    output = getattr(lhs, method_str)(rhs)
+                    output = getattr(lhs, method_names[op])(rhs)
             else:
-                if inst.op == _OPCode.ACOS:
-                    output = getattr(sympy, "acos")(lhs)
-                elif inst.op == _OPCode.ASIN:
-                    output = getattr(sympy, "asin")(lhs)
-                elif inst.op == _OPCode.ATAN:
-                    output = getattr(sympy, "atan")(lhs)
-                elif inst.op == _OPCode.ABS:
-                    output = getattr(sympy, "Abs")(lhs)
-                else:
-                    output = getattr(sympy, method_str)(lhs)
+                output = sympy_funcs[op](lhs)
         return output
 
 
@@ -147,7 +147,7 @@ def _write_parameter_expression_v13(file_obj, obj, version):
     # A symbol is `Parameter` or `ParameterVectorElement`.
     # `symbol_map` maps symbols to ParameterExpression (which may be a symbol).
     symbol_map = {}
-    for inst in obj._qpy_replay:
+    for inst in obj._qpy_replay or ():
         if isinstance(inst, _SUBS):
             symbol_map.update(_encode_replay_subs(inst, file_obj, version))
             continue
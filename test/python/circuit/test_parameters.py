@@ -333,6 +333,62 @@ class TestParameters(QiskitTestCase):
         c = a.bind({a: 1, b: 1}, allow_unknown_parameters=True)
         self.assertEqual(c, a.bind({a: 1}))
 
+    def test_raise_if_bind_unknown_parameters(self):
+        """Verify we raise if asked to bind a parameter not in the expression."""
+        a = Parameter("a")
+        b = Parameter("b")
+        c = Parameter("c")
+        expr = a + b
+        # Binding every parameter of the expression as well as an unknown one.
+        with self.assertRaisesRegex(CircuitError, "not present"):
+            expr.bind({a: 1, b: 1, c: 1})
+        # Binding only some of the parameters of the expression.
+        with self.assertRaisesRegex(CircuitError, "not present"):
+            expr.bind({a: 1, c: 1})
+        partial = expr.bind({a: 1, c: 1}, allow_unknown_parameters=True)
+        self.assertEqual(partial.parameters, {b})
+
+    def test_bind_non_numeric_value_raises(self):
+        """Test that binding a non-numeric value to an expression raises."""
+        a = Parameter("a")
+        b = Parameter("b")
+        expr = a + b
+        with self.assertRaisesRegex(CircuitError, r"non-numeric.*Parameter\(b\): '2\.0'"):
+            expr.bind({a: 1.0, b: "2.0"})
+        # Unknown parameters are ignored, but their values must still be numeric.
+        with self.assertRaisesRegex(CircuitError, r"non-numeric.*Parameter\(c\): '2\.0'"):
+            expr.bind({a: 1.0, Parameter("c"): "2.0"}, allow_unknown_parameters=True)
+        # Objects that merely convert to a number are still rejected.
+        with self.assertRaisesRegex(CircuitError, "non-numeric"):
+            expr.bind({a: 1.0, b: numpy.array(2.0)})
+        with self.assertRaisesRegex(CircuitError, "non-numeric"):
+            expr.bind({a: 1.0, b: (a + 1).bind({a: 1.0})})
+
+    def test_bind_infinite_value_raises(self):
+        """Test that binding an infinite value, or dividing by a zero binding, raises."""
+        x = Parameter("x")
+        with self.assertRaisesRegex(ZeroDivisionError, "infinite binding"):
+            x.bind({x: float("inf")})
+        with self.assertRaisesRegex(ZeroDivisionError, "division by zero"):
+            (1 / x).bind({x: 0})
+
+    def test_bind_many_parameters(self):
+        """Test binding an expression containing many parameters all at once."""
+        params = ParameterVector("v", 1000)
+        expr = sum(params[1:], params[0])
+        bound = expr.bind({p: float(i) for i, p in enumerate(params)})
+        self.assertEqual(bound.parameters, set())
+        self.assertEqual(bound.numeric(), float(sum(range(1000))))
+
+    def test_bind_numpy_values(self):
+        """Test binding values taken from Numpy arrays."""
+        params = ParameterVector("v", 3)
+        expr = params[0] + 2 * params[1] + 3 * params[2]
+        bound = expr.bind(dict(zip(params, numpy.array([0.5, 1.5, 2.5]))))
+        self.assertEqual(bound.numeric(), 11.0)
+        bound = expr.bind(dict(zip(params, numpy.array([1, 2, 3], dtype=numpy.int64))))
+        self.assertEqual(bound.numeric(), 14)
+
     def test_assign_parameters_by_name(self):
         """Test that parameters can be assigned by name as well as value."""
         a = Parameter("a")
@@ -902,6 +958,32 @@ class TestParameters(QiskitTestCase):
         self.assertEqual([p.index for p in x1_p], list(range(len(x1_p))))
         self.assertEqual([p.index for p in x2_p], list(range(len(x2_p))))
 
+    def test_expression_with_long_history_through_serialization(self):
+        """Verify expressions built from many operations survive serialization."""
+        x = Parameter("x")
+        expr = x
+        for _ in range(2000):
+            expr = expr + 1
+
+        expr_p = pickle.loads(pickle.dumps(expr))
+
+        self.assertEqual(expr, expr_p)
+        self.assertEqual(len(list(expr_p._qpy_replay)), 2000)
+        self.assertEqual(expr_p.bind({x: 1.0}), 2001.0)
+
+    def test_expression_hash_through_serialization(self):
+        """Verify the hash of an expression is consistent through serialization."""
+        x = Parameter("x")
+        expr = 2 * x + 1
+        expected = hash(expr)
+        # Hashing is cached, so the second call must agree with the first.
+        self.assertEqual(hash(expr), expected)
+
+        expr_p = pickle.loads(pickle.dumps(expr))
+        self.assertEqual(expr, expr_p)
+        self.assertEqual(hash(expr_p), expected)
+        self.assertEqual({expr: 1}[expr_p], 1)
+
     @data("single", "vector")
     def test_parameter_equality_to_expression(self, ptype):
         """Verify that parameters compare equal to `ParameterExpression`s that represent the same